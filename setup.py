@@ -0,0 +1,22 @@
+"""
+Сборка Cython-расширений.
+
+Все модули из ``src`` компилируются в нативные расширения, исходные ``.py``
+остаются рядом и импортируются, если сборка не выполнялась:
+
+    python setup.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="FastAI",
+    package_dir={"": "src"},
+    py_modules=[],
+    ext_modules=cythonize(
+        ["src/*.py"],
+        # annotation_typing выключен: аннотации нужны FastAPI и Pydantic как есть,
+        # иначе Cython начинает проверять `site_id: int = Path(...)` как C-тип
+        compiler_directives={"language_level": 3, "boundscheck": False, "annotation_typing": False},
+    ),
+)
@@ -1,231 +1,51 @@
 import asyncio
 
+import orjson
+
 from datetime import datetime, timezone
-from fastapi import FastAPI, HTTPException, Path
-from fastapi.responses import JSONResponse, StreamingResponse
-from fastapi.staticfiles import StaticFiles
+from functools import lru_cache
+from fastapi import FastAPI, Path, Request
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 
 from pathlib import Path as PathLib
-from pydantic import BaseModel, ConfigDict, Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Annotated
-
-# Импортируем мок HTML
-from mock_html import MOCK_HTML
-
-
-FRONTEND_DIR = PathLib(__file__).parent / "frontend"
-STATIC_FILES_DIR = PathLib(__file__).parent / "static"
-
-
-app = FastAPI(title="FastAI App", version="1.0.0")
-
-
-def to_camel_case(snake_str: str) -> str:
-    """Преобразование названия поля в camelCase"""
-    components = snake_str.split('_')
-    return components[0] + ''.join(word.capitalize() for word in components[1:])
-
-
-# === PYDANTIC МОДЕЛИ ДАННЫХ ===
-
-class UserDetailsResponse(BaseModel):
-    """
-    Модель ответа с детальной информацией о пользователе.
-
-    Attributes:
-        profile_id: Уникальный идентификатор профиля в системе
-        username: Отображаемое имя пользователя
-        email: Контактный email адрес
-        is_active: Флаг активности учетной записи
-        registered_at: Дата и время регистрации
-        updated_at: Дата и время последнего обновления информации
-
-    Example:
-        >>> UserDetailsResponse(
-        ...     profile_id="1",
-        ...     username="user123",
-        ...     email="test@example.com",
-        ...     is_active=True
-        ... )
-        UserDetailsResponse(
-            profile_id='1',
-            username='user123',
-            email='test@example.com',
-            is_active=True,
-            registered_at=datetime.datetime(...),
-            updated_at=datetime.datetime(...)
-        )
-    """
-    profile_id: str = Field(..., examples=["1"])
-    username: str = Field(..., examples=["user123"])
-    email: str = Field(..., examples=["example@example.com"])
-    is_active: bool = Field(..., examples=[True])
-    registered_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "email": "example@example.com",
-                "is_active": True,
-                "profile_id": "1",
-                "registered_at": "2025-06-15T18:29:56+00:00",
-                "updated_at": "2025-06-15T18:29:56+00:00",
-                "username": "user123",
-            }
-        },
-        alias_generator=to_camel_case,
-        populate_by_name=True,
-        use_attribute_docstrings=True
-    )
-
-
-class CreateSiteRequest(BaseModel):
-    """
-    Модель запроса для создания сайта.
-
-    Attributes:
-        title: Название сайта (необязательное, макс. 128 символов)
-        prompt: Описание или промт для сайта (обязательное)
-    """
-    title: str | None = Field(
-        default=None,
-        max_length=128,
-        examples=["Фан клуб игры в домино"],
-        description="Название сайта, не более 128 символов"
-    )
-    prompt: str = Field(
-        ...,
-        examples=["Сайт любителей играть в домино"],
-        description="Описание или промт для создания сайта"
-    )
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "title": "Фан клуб игры в домино",
-                    "prompt": "Сайт любителей играть в домино"
-                },
-                {
-                    "title": None,
-                    "prompt": "Сайт без названия"
-                }
-            ]
-        }
-    )
-
-
-class CreateSiteResponse(BaseModel):
-    id: int = Field(..., examples=[1])
-    title: str | None = Field(..., examples=["Фан клуб Домино"], description="Название сайта, может быть null")
-    prompt: str = Field(..., examples=["Сайт любителей играть в домино"])
-    html_code_url: str = Field(..., examples=["http://example.com/media/index.html"])
-    html_code_download_url: str = Field(
-        ...,
-        examples=["http://example.com/media/index.html?response-content-disposition=attachment"]
-    )
-    screenshot_url: str = Field(..., examples=["http://example.com/media/index.png"])
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    model_config = ConfigDict(
-        alias_generator=to_camel_case,
-        populate_by_name=True,
-        json_schema_extra={
-            "example": {
-                "id": 1,
-                "site_id": 1,
-                "title": "Фан клуб Домино",
-                "prompt": "Сайт любителей играть в домино",
-                "html_code_url": "http://example.com/media/index.html",
-                "html_code_download_url": "http://example.com/media/index.html?response-content-disposition=attachment",
-                "screenshot_url": "http://example.com/media/index.png",
-                "created_at": "2025-06-15T18:29:56+00:00",
-                "updated_at": "2025-06-15T18:29:56+00:00",
-            }
-        }
-    )
 
+from schemas import (
+    SITE_EXAMPLE,
+    USER_EXAMPLE,
+    CreateSiteRequest,
+    CreateSiteResponse,
+    GeneratedSitesResponse,
+    SiteGenerationRequest,
+    SiteResponse,
+    UserDetailsResponse,
+    utc_now,
+)
+from static_files import HASHED_ASSET_RE, CachedStaticFiles
 
-class SiteGenerationRequest(BaseModel):
-    """
-    Модель запроса для генерации HTML кода сайта.
 
-    Attributes:
-        prompt: Промт для генерации контента сайта
-    """
-    prompt: str = Field(
-        ...,
-        examples=["Сайт любителей играть в домино"],
-        description="Промт для генерации HTML контента"
-    )
+BASE_DIR = PathLib(__file__).resolve().parent
+FRONTEND_DIR = BASE_DIR / "frontend"
+STATIC_FILES_DIR = BASE_DIR / "static"
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "prompt": "Сайт любителей играть в домино"
-            }
-        }
-    )
+# Экземпляры раздачи статики создаются один раз при импорте и только монтируются ниже
+STATIC_FILES = CachedStaticFiles(directory=STATIC_FILES_DIR)
+FRONTEND_FILES = CachedStaticFiles(directory=FRONTEND_DIR, html=True, immutable_pattern=HASHED_ASSET_RE)
 
 
-class SiteResponse(BaseModel):
-    """
-    Модель ответа с информацией о сайте.
-
-    Attributes:
-        id: Уникальный идентификатор сайта
-        title: Название сайта
-        prompt: Промт использованный для генерации
-        html_code_url: URL HTML кода (может быть null)
-        html_code_download_url: URL для скачивания HTML (может быть null)
-        screenshot_url: URL скриншота (может быть null)
-        created_at: Дата создания
-        updated_at: Дата обновления
-    """
-    id: int = Field(..., examples=[1])
-    title: str = Field(..., examples=["Фан клуб Домино"])
-    prompt: str = Field(..., examples=["Сайт любителей играть в домино"])
-    html_code_url: str | None = Field(
-        default=None,
-        examples=["http://example.com/media/index.html"],
-        description="URL HTML кода сайта"
-    )
-    html_code_download_url: str | None = Field(
-        default=None,
-        examples=["http://example.com/media/index.html?response-content-disposition=attachment"],
-        description="URL для скачивания HTML кода"
-    )
-    screenshot_url: str | None = Field(
-        default=None,
-        examples=["http://example.com/media/index.png"],
-        description="URL скриншота сайта"
-    )
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    model_config = ConfigDict(
-        alias_generator=to_camel_case,
-        populate_by_name=True,
-        json_schema_extra={
-            "example": {
-                "id": 1,
-                "title": "Фан клуб Домино",
-                "prompt": "Сайт любителей играть в домино",
-                "html_code_url": "http://example.com/media/index.html",
-                "html_code_download_url": "http://example.com/media/index.html?response-content-disposition=attachment",
-                "screenshot_url": "http://example.com/media/index.png",
-                "created_at": "2025-06-15T18:29:56+00:00",
-                "updated_at": "2025-06-15T18:29:56+00:00",
-            }
-        }
-    )
+OPENAPI_URL = "/openapi.json"
+DOCS_URL = "/docs"
+REDOC_URL = "/redoc"
 
-
-class GeneratedSitesResponse(BaseModel):
-    sites: list[SiteResponse]
+# Схема и страницы документации отдаются своими эндпоинтами ниже, см. get_openapi_json
+app = FastAPI(
+    title="FastAI App",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
+)
 
 
 # === Мок-данные ===
@@ -243,31 +63,63 @@ MOCK_SITE = SiteResponse(
 
 
 MOCK_SITES_LIST = [MOCK_SITE, ]
+MOCK_SITE_IDS = frozenset(site.id for site in MOCK_SITES_LIST)
+
+
+MOCK_USER = {
+    "profile_id": "1",
+    "username": "user123",
+    "email": "example@example.com",
+    "is_active": True,
+    "registered_at": "2025-06-15T18:29:56+00:00",
+    "updated_at": "2025-06-15T18:29:56+00:00",
+}
+
+
+# Мок-данные не меняются, поэтому сериализуем их один раз при импорте
+MOCK_USER_BYTES = orjson.dumps(MOCK_USER)
+MOCK_SITE_BYTES = orjson.dumps(MOCK_SITE.model_dump(mode="json", by_alias=True))
+MOCK_SITES_LIST_BYTES = orjson.dumps(
+    GeneratedSitesResponse(sites=MOCK_SITES_LIST).model_dump(mode="json", by_alias=True)
+)
+
+
+# Тело 404 не зависит от запроса, поэтому кодируется один раз. Сам Response создается
+# на каждый запрос: FastAPI записывает в него фоновые задачи запроса
+SITE_NOT_FOUND_BYTES = orjson.dumps({"detail": "Site not found"})
 
 
 # === Генератор чанков для стриминга ===
 
-async def generate_html_chunks(prompt: str, site_id: int):
-    """Генерирует HTML контент чанками на основе промта."""
-    # Примерная реализация - замените на реальную логику
-    html_template = f"""
+# Шаблон кодируется один раз при импорте, на запрос кодируется только промт
+HTML_TEMPLATE_BYTES = """
     <!DOCTYPE html>
     <html>
     <head>
-        <title>Сайт #{site_id}</title>
+        <title>Сайт #%d</title>
     </head>
     <body>
-        <h1>Сгенерировано на основе: {prompt}</h1>
+        <h1>Сгенерировано на основе: %s</h1>
         <p>Контент сайта...</p>
     </body>
     </html>
-    """
+    """.encode()
+
+HTML_CHUNK_SIZE = 8192
+
+
+async def generate_html_chunks(prompt: str, site_id: int):
+    """Генерирует HTML контент чанками на основе промта."""
+    # Примерная реализация - замените на реальную логику.
+    # Запросы к LLM делать через общий httpx.AsyncClient, параллельные вызовы
+    # объединять в asyncio.TaskGroup; блокирующие requests/time.sleep здесь остановят весь event loop
+    html_view = memoryview(HTML_TEMPLATE_BYTES % (site_id, prompt.encode("utf-8")))
 
-    # Эмуляция streaming - отдаем чанками
-    chunk_size = 100
-    for i in range(0, len(html_template), chunk_size):
-        yield html_template[i:i + chunk_size]
-        await asyncio.sleep(0.1)
+    # Эмуляция streaming - отдаем чанками, темп задает back-pressure клиента,
+    # sleep(0) лишь возвращает управление event loop между чанками
+    for i in range(0, len(html_view), HTML_CHUNK_SIZE):
+        yield bytes(html_view[i:i + HTML_CHUNK_SIZE])
+        await asyncio.sleep(0)
 
 
 # === ЭНДПОИНТЫ ===
@@ -275,24 +127,15 @@ async def generate_html_chunks(prompt: str, site_id: int):
 # 1. GET: /users/me
 @app.get(
     "/users/me",
-    response_model=UserDetailsResponse,
     summary="Получить учетные данные пользователя",
     response_description="Содержит информацию о текущем пользователе",
     tags=["Users"],
     responses={
         200: {
+            "model": UserDetailsResponse,
             "description": "Successful Response",
             "content": {
-                "application/json": {
-                    "example": {
-                        "email": "example@example.com",
-                        "is_active": True,
-                        "profile_id": "1",
-                        "registered_at": "2025-06-15T18:29:56+00:00",
-                        "updated_at": "2025-06-15T18:29:56+00:00",
-                        "username": "user123",
-                    }
-                }
+                "application/json": {"example": USER_EXAMPLE}
             },
         },
         401: {
@@ -301,54 +144,34 @@ async def generate_html_chunks(prompt: str, site_id: int):
         },
     },
 )
-def mock_get_current_user() -> JSONResponse:
-    mock_user_data = {
-        "profile_id": "1",
-        "username": "user123",
-        "email": "example@example.com",
-        "is_active": True,
-        "registered_at": "2025-06-15T18:29:56+00:00",
-        "updated_at": "2025-06-15T18:29:56+00:00",
-    }
-    return JSONResponse(content=mock_user_data, status_code=200)
+async def mock_get_current_user() -> Response:
+    return Response(content=MOCK_USER_BYTES, media_type="application/json", status_code=200)
 
 
 # 2. GET: /sites/my
 @app.get(
     "/sites/my",
-    response_model=GeneratedSitesResponse,
     summary="Получить список сгенерированных сайтов текущего пользователя",
     response_description="Список созданных пользователем сайтов",
     tags=["Sites"],
-    responses={200: {"description": "Successful Response"}},
+    responses={200: {"model": GeneratedSitesResponse, "description": "Successful Response"}},
 )
-async def mock_get_user_sites():
-    return {"sites": MOCK_SITES_LIST}
+async def mock_get_user_sites() -> Response:
+    return Response(content=MOCK_SITES_LIST_BYTES, media_type="application/json")
 
 
 # 3. POST: /sites/create
 @app.post(
     "/sites/create",
-    response_model=CreateSiteResponse,
     summary="Создать сайт",
     response_description="Возвращает информацию о созданном сайте",
     tags=["Sites"],
     responses={
         200: {
+            "model": CreateSiteResponse,
             "description": "Successful Response",
             "content": {
-                "application/json": {
-                    "example": {
-                        "id": 1,
-                        "title": "Фан клуб Домино",
-                        "prompt": "Сайт любителей играть в домино",
-                        "created_at": "2025-06-15T18:29:56+00:00",
-                        "updated_at": "2025-06-15T18:29:56+00:00",
-                        "html_code_url": "http://example.com/media/index.html",
-                        "html_code_download_url": "http://example.com/media/index.html?response-content-disposition=attachment",
-                        "screenshot_url": "http://example.com/media/index.png"
-                    }
-                }
+                "application/json": {"example": SITE_EXAMPLE}
             },
         },
         422: {
@@ -387,10 +210,10 @@ async def mock_get_user_sites():
         },
     },
 )
-async def mock_create_site(request: CreateSiteRequest):
-    current_time = datetime.now(timezone.utc)
+async def mock_create_site(request: CreateSiteRequest) -> Response:
+    current_time = utc_now()
 
-    return CreateSiteResponse(
+    site = CreateSiteResponse(
         id=1,
         title=request.title,
         prompt=request.prompt,
@@ -400,6 +223,10 @@ async def mock_create_site(request: CreateSiteRequest):
         html_code_download_url="http://example.com/media/index.html?response-content-disposition=attachment",
         screenshot_url="http://example.com/media/index.png"
     )
+    return Response(
+        content=site.model_dump_json(by_alias=True),
+        media_type="application/json",
+    )
 
 
 # 4. POST: /sites/{site_id}/generate
@@ -468,12 +295,12 @@ async def mock_generate_site_html(
       -d '{"prompt": "Сайт любителей играть в домино"}'
     ```
     """
-    if id != 1:
-        raise HTTPException(status_code=404, detail="Site not found")
+    if site_id not in MOCK_SITE_IDS:
+        return Response(content=SITE_NOT_FOUND_BYTES, status_code=404, media_type="application/json")
 
     return StreamingResponse(
         generate_html_chunks(request.prompt, site_id),
-        media_type="text/html",
+        media_type="text/html; charset=utf-8",
         headers={"Content-Disposition": f"attachment; filename=site_{site_id}.html"}
     )
 
@@ -481,26 +308,15 @@ async def mock_generate_site_html(
 # 5. GET: /sites/{site_id}
 @app.get(
     "/sites/{site_id}",
-    response_model=SiteResponse,
     summary="Получить сайт",
     description="Возвращает полную информацию о сайте по его ID",
     tags=["Sites"],
     responses={
         200: {
+            "model": SiteResponse,
             "description": "Информация о сайте",
             "content": {
-                "application/json": {
-                    "example": {
-                        "id": 1,
-                        "title": "Фан клуб Домино",
-                        "prompt": "Сайт любителей играть в домино",
-                        "html_code_url": "http://example.com/media/index.html",
-                        "html_code_download_url": "http://example.com/media/index.html?response-content-disposition=attachment",
-                        "screenshot_url": "http://example.com/media/index.png",
-                        "created_at": "2025-06-15T18:29:56+00:00",
-                        "updated_at": "2025-06-15T18:29:56+00:00",
-                    }
-                }
+                "application/json": {"example": SITE_EXAMPLE}
             }
         },
         404: {
@@ -532,28 +348,76 @@ async def mock_generate_site_html(
         },
     },
 )
-async def mock_get_site(site_id: int = Path(..., description="ID сайта", examples=[1])):
+async def mock_get_site(site_id: int = Path(..., description="ID сайта", examples=[1])) -> Response:
     """
     Получить информацию о сайте по ID.
 
     Args:
         site_id: ID сайта для получения информации
     """
-    if site_id != 1:
-        raise HTTPException(status_code=404, detail="Site not found")
+    if site_id not in MOCK_SITE_IDS:
+        return Response(content=SITE_NOT_FOUND_BYTES, status_code=404, media_type="application/json")
+
+    return Response(content=MOCK_SITE_BYTES, media_type="application/json")
+
+
+# === ДОКУМЕНТАЦИЯ API ===
+
+def get_root_path(request: Request) -> str:
+    """Префикс, под которым приложение смонтировано за прокси"""
+    return request.scope.get("root_path", "").rstrip("/")
+
+
+@lru_cache(maxsize=16)
+def get_openapi_bytes(root_path: str) -> bytes:
+    """
+    OpenAPI-схема, сериализованная один раз для каждого root_path.
+
+    Как и встроенный эндпоинт FastAPI, добавляет root_path первым в servers.
+    """
+    openapi_schema = app.openapi()
+    server_urls = {server.get("url") for server in app.servers}
+    if root_path and app.root_path_in_servers and root_path not in server_urls:
+        openapi_schema = {**openapi_schema, "servers": [{"url": root_path}, *app.servers]}
+    return orjson.dumps(openapi_schema)
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def get_openapi_json(request: Request) -> Response:
+    return Response(content=get_openapi_bytes(get_root_path(request)), media_type="application/json")
+
+
+@app.get(DOCS_URL, include_in_schema=False)
+async def get_swagger_ui(request: Request) -> HTMLResponse:
+    root_path = get_root_path(request)
+    return get_swagger_ui_html(
+        openapi_url=root_path + OPENAPI_URL,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=root_path + app.swagger_ui_oauth2_redirect_url,
+        init_oauth=app.swagger_ui_init_oauth,
+        swagger_ui_parameters=app.swagger_ui_parameters,
+    )
+
+
+@app.get(app.swagger_ui_oauth2_redirect_url, include_in_schema=False)
+async def get_swagger_ui_redirect() -> HTMLResponse:
+    return get_swagger_ui_oauth2_redirect_html()
+
 
-    return MOCK_SITE
+@app.get(REDOC_URL, include_in_schema=False)
+async def get_redoc(request: Request) -> HTMLResponse:
+    return get_redoc_html(openapi_url=get_root_path(request) + OPENAPI_URL, title=f"{app.title} - ReDoc")
 
 
 app.mount(
     "/static",
-    StaticFiles(directory=STATIC_FILES_DIR),
+    STATIC_FILES,
     name="static-files",
 )
 
 
 app.mount(
     "/",
-    StaticFiles(directory=FRONTEND_DIR, html=True),
+    FRONTEND_FILES,
     name="frontend",
 )
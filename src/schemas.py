@@ -0,0 +1,208 @@
+from datetime import datetime, timezone
+from functools import cache
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+@cache
+def to_camel_case(snake_str: str) -> str:
+    """Преобразование названия поля в camelCase (результат кешируется по имени поля)"""
+    components = snake_str.split('_')
+    return components[0] + ''.join(word.capitalize() for word in components[1:])
+
+
+def utc_now() -> datetime:
+    """Текущее время в UTC, общая фабрика для полей с датами"""
+    return datetime.now(timezone.utc)
+
+
+# === ПРИМЕРЫ ДЛЯ OPENAPI ===
+
+USER_EXAMPLE = {
+    "email": "example@example.com",
+    "is_active": True,
+    "profile_id": "1",
+    "registered_at": "2025-06-15T18:29:56+00:00",
+    "updated_at": "2025-06-15T18:29:56+00:00",
+    "username": "user123",
+}
+
+SITE_EXAMPLE = {
+    "id": 1,
+    "title": "Фан клуб Домино",
+    "prompt": "Сайт любителей играть в домино",
+    "html_code_url": "http://example.com/media/index.html",
+    "html_code_download_url": "http://example.com/media/index.html?response-content-disposition=attachment",
+    "screenshot_url": "http://example.com/media/index.png",
+    "created_at": "2025-06-15T18:29:56+00:00",
+    "updated_at": "2025-06-15T18:29:56+00:00",
+}
+
+CREATE_SITE_REQUEST_EXAMPLES = [
+    {
+        "title": "Фан клуб игры в домино",
+        "prompt": "Сайт любителей играть в домино"
+    },
+    {
+        "title": None,
+        "prompt": "Сайт без названия"
+    }
+]
+
+SITE_GENERATION_REQUEST_EXAMPLE = {
+    "prompt": "Сайт любителей играть в домино"
+}
+
+
+# === PYDANTIC МОДЕЛИ ДАННЫХ ===
+
+class UserDetailsResponse(BaseModel):
+    """
+    Модель ответа с детальной информацией о пользователе.
+
+    Attributes:
+        profile_id: Уникальный идентификатор профиля в системе
+        username: Отображаемое имя пользователя
+        email: Контактный email адрес
+        is_active: Флаг активности учетной записи
+        registered_at: Дата и время регистрации
+        updated_at: Дата и время последнего обновления информации
+
+    Example:
+        >>> UserDetailsResponse(
+        ...     profile_id="1",
+        ...     username="user123",
+        ...     email="test@example.com",
+        ...     is_active=True
+        ... )
+        UserDetailsResponse(
+            profile_id='1',
+            username='user123',
+            email='test@example.com',
+            is_active=True,
+            registered_at=datetime.datetime(...),
+            updated_at=datetime.datetime(...)
+        )
+    """
+    profile_id: str = Field(..., examples=["1"])
+    username: str = Field(..., examples=["user123"])
+    email: str = Field(..., examples=["example@example.com"])
+    is_active: bool = Field(..., examples=[True])
+    registered_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": USER_EXAMPLE},
+        alias_generator=to_camel_case,
+        populate_by_name=True,
+        use_attribute_docstrings=True
+    )
+
+
+class CreateSiteRequest(BaseModel):
+    """
+    Модель запроса для создания сайта.
+
+    Attributes:
+        title: Название сайта (необязательное, макс. 128 символов)
+        prompt: Описание или промт для сайта (обязательное)
+    """
+    title: str | None = Field(
+        default=None,
+        max_length=128,
+        examples=["Фан клуб игры в домино"],
+        description="Название сайта, не более 128 символов"
+    )
+    prompt: str = Field(
+        ...,
+        examples=["Сайт любителей играть в домино"],
+        description="Описание или промт для создания сайта"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": CREATE_SITE_REQUEST_EXAMPLES}
+    )
+
+
+class CreateSiteResponse(BaseModel):
+    id: int = Field(..., examples=[1])
+    title: str | None = Field(..., examples=["Фан клуб Домино"], description="Название сайта, может быть null")
+    prompt: str = Field(..., examples=["Сайт любителей играть в домино"])
+    html_code_url: str = Field(..., examples=["http://example.com/media/index.html"])
+    html_code_download_url: str = Field(
+        ...,
+        examples=["http://example.com/media/index.html?response-content-disposition=attachment"]
+    )
+    screenshot_url: str = Field(..., examples=["http://example.com/media/index.png"])
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    model_config = ConfigDict(
+        alias_generator=to_camel_case,
+        populate_by_name=True,
+        json_schema_extra={"example": {**SITE_EXAMPLE, "site_id": 1}}
+    )
+
+
+class SiteGenerationRequest(BaseModel):
+    """
+    Модель запроса для генерации HTML кода сайта.
+
+    Attributes:
+        prompt: Промт для генерации контента сайта
+    """
+    prompt: str = Field(
+        ...,
+        examples=["Сайт любителей играть в домино"],
+        description="Промт для генерации HTML контента"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": SITE_GENERATION_REQUEST_EXAMPLE}
+    )
+
+
+class SiteResponse(BaseModel):
+    """
+    Модель ответа с информацией о сайте.
+
+    Attributes:
+        id: Уникальный идентификатор сайта
+        title: Название сайта
+        prompt: Промт использованный для генерации
+        html_code_url: URL HTML кода (может быть null)
+        html_code_download_url: URL для скачивания HTML (может быть null)
+        screenshot_url: URL скриншота (может быть null)
+        created_at: Дата создания
+        updated_at: Дата обновления
+    """
+    id: int = Field(..., examples=[1])
+    title: str = Field(..., examples=["Фан клуб Домино"])
+    prompt: str = Field(..., examples=["Сайт любителей играть в домино"])
+    html_code_url: str | None = Field(
+        default=None,
+        examples=["http://example.com/media/index.html"],
+        description="URL HTML кода сайта"
+    )
+    html_code_download_url: str | None = Field(
+        default=None,
+        examples=["http://example.com/media/index.html?response-content-disposition=attachment"],
+        description="URL для скачивания HTML кода"
+    )
+    screenshot_url: str | None = Field(
+        default=None,
+        examples=["http://example.com/media/index.png"],
+        description="URL скриншота сайта"
+    )
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    model_config = ConfigDict(
+        alias_generator=to_camel_case,
+        populate_by_name=True,
+        json_schema_extra={"example": SITE_EXAMPLE}
+    )
+
+
+class GeneratedSitesResponse(BaseModel):
+    sites: list[SiteResponse]
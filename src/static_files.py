@@ -0,0 +1,47 @@
+import os
+import re
+
+from fastapi.responses import Response
+from fastapi.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Хеш содержимого в имени файла, как его пишут сборщики фронтенда:
+# webpack -- hex через точку, хотя бы с одной буквой a-f, чтобы не ловить даты (main.3f9a1c2b.js),
+# Vite -- 8 символов base64url через дефис, только в каталоге assets и хотя бы с одной цифрой
+# или "_", чтобы не ловить слова вроде settings или SemiBold (assets/index-BXa12_3f.css)
+HASHED_ASSET_RE = re.compile(
+    r"(?:\.(?=[0-9a-f]*[a-f])[0-9a-f]{8,}"
+    r"|[/\\]assets[/\\][^/\\]+-(?=[A-Za-z0-9_-]{0,7}[0-9_])[A-Za-z0-9_-]{8})\.\w+$"
+)
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    Раздача статики с заголовками Cache-Control.
+
+    HTML отдается с no-cache, чтобы новая сборка фронтенда подхватывалась сразу.
+    Файлы, путь которых совпал с immutable_pattern, кешируются браузером на год
+    без перепроверки. По умолчанию шаблон не задан: включать его стоит только
+    для каталога сборки фронтенда, где имена файлов содержат хеш содержимого.
+    """
+
+    def __init__(self, *args, immutable_pattern: re.Pattern[str] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.immutable_pattern = immutable_pattern
+
+    def file_response(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if self.immutable_pattern is not None and self.immutable_pattern.search(full_path):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        elif full_path.endswith(".html"):
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response